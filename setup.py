@@ -43,8 +43,10 @@ if __name__ == '__main__':
             'cometml': ['cometml'],
             'mongo': ['pymongo'],
             'orion': ['orion.core'],
+            'orjson': ['orjson'],
             'all': [
                 'orion.core',
+                'orjson',
                 'pymongo',
                 'psycopg2-binary'
             ]
@@ -1,4 +1,5 @@
 from track.client import TrackClient, TrialDoesNotExist
+from track.persistence import register
 from tests.config import Remove
 import os
 
@@ -90,9 +91,66 @@ def test_client_orion_integration(file='client_orion_integration'):
         os.environ = old_environ
 
 
+def test_client_forwarded_methods(file='client_forward'):
+    with Remove(file):
+        client = TrackClient(f'file://{file}.json')
+        client.set_project(name='test_client')
+
+        old = client.new_trial(name='old', arguments=dict(batch_size=256))
+        assert client.log_metrics.__self__ is old
+
+        new = client.new_trial(force=True, name='new', arguments=dict(batch_size=128))
+        assert client.log_metrics.__self__ is new
+
+
+class RecordingProtocol:
+    """Remote backend stand-in that records the calls that attach trials"""
+    def __init__(self, uri):
+        self.calls = []
+
+    def get_project(self, project):
+        return None
+
+    def new_project(self, project):
+        return project
+
+    def get_trial_group(self, group):
+        return None
+
+    def new_trial_group(self, group):
+        return group
+
+    def new_trial(self, trial, auto_increment=False):
+        return trial
+
+    def add_project_trial(self, project, trial):
+        self.calls.append('add_project_trial')
+
+    def add_group_trial(self, group, trial):
+        self.calls.append('add_group_trial')
+
+
+def test_client_multiplexed_attach_trial():
+    register('recording', RecordingProtocol)
+
+    client = TrackClient('recording://test')
+    client.set_project(name='test_client')
+    client.set_group(name='test_group')
+    client.new_trial(arguments=dict(batch_size=256))
+
+    remote = client.protocol.protos[-1]
+    assert remote.calls == ['add_project_trial', 'add_group_trial']
+
+    # reusing the trial does not attach it a second time
+    client.new_trial(force=True, arguments=dict(batch_size=256))
+    assert remote.calls == ['add_project_trial', 'add_group_trial']
+
+
 if __name__ == '__main__':
     test_client_capture_output()
     test_client_no_group()
     test_client_set_trial_throw()
     test_client_orion_integration()
+    test_client_forwarded_methods()
+    test_client_multiplexed_attach_trial()
 
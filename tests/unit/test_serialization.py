@@ -1,5 +1,12 @@
+import json
+import math
+import os
+import tempfile
+
 from track.structure import Status, Project, TrialGroup, Trial
-from track.serialization import to_json, from_json
+from track.serialization import to_json, from_json, dumps, loads
+from track.persistence.storage import LocalStorage, load_database
+from track.aggregators.aggregator import TimeSeriesAggregator
 
 
 def test_project():
@@ -51,7 +58,54 @@ def test_trial():
     assert p == ps
 
 
+def test_dumps():
+    ts = TimeSeriesAggregator()
+    for i in range(0, 30):
+        ts.append(i)
+
+    t = Trial(
+        name='name',
+        version='version',
+        parameters=dict(a=1, b=2),
+        metadata=dict(_update_count=2, b=3),
+        metrics=dict(a={1: 3, 2: 4}, b=ts, c={(1, 2): 5, True: 6, None: 7})
+    )
+    p = Project(name='1', trials={t})
+
+    for short in (True, False):
+        for exact in (True, False):
+            assert json.loads(dumps([p], short, exact=exact)) == [to_json(p, short)]
+
+    assert json.loads(dumps(t))['metrics']['c'] == {'(1, 2)': 5, 'True': 6, 'None': 7}
+
+    # plain dictionaries, e.g. the payloads of the cockroach backend
+    data = {'a': {(1, 2): 3}, True: 1, None: 2}
+    for exact in (True, False):
+        assert json.loads(dumps(data, exact=exact)) == to_json(data)
+
+    # short serialization does not modify the trial
+    assert '_update_count' in t.metadata
+
+
+def test_nan_round_trip():
+    data = loads(dumps({'3': float('nan'), '4': float('inf')}))
+    assert math.isnan(data['3'])
+    assert data['4'] == float('inf')
+
+    t = Trial(name='name', version='version', metrics=dict(loss={3: float('nan')}))
+    p = Project(name='nan', trials={t})
+
+    with tempfile.TemporaryDirectory() as folder:
+        file_name = os.path.join(folder, 'nan.json')
+        LocalStorage(target_file=file_name, _objects={p.uid: p}, _projects={p.uid}).commit()
+
+        loss = load_database(file_name).objects[t.uid].metrics['loss']
+        assert math.isnan(loss['3'])
+
+
 if __name__ == '__main__':
     test_project()
     test_trial_group()
     test_trial()
+    test_dumps()
+    test_nan_round_trip()
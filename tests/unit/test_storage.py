@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+from track.persistence.local import FileProtocol
+from track.persistence.storage import load_database
+from track.structure import Project, Trial
+
+
+def test_trial_revisions():
+    with tempfile.TemporaryDirectory() as folder:
+        file_name = os.path.join(folder, 'revisions.json')
+
+        backend = FileProtocol(f'file://{file_name}')
+        project = backend.new_project(Project(name='revisions'))
+
+        def make_trial():
+            return Trial(name='trial', version='1', parameters={'batch': 256}, project_id=project.uid)
+
+        rev0 = backend.new_trial(make_trial(), auto_increment=True)
+        rev1 = backend.new_trial(make_trial(), auto_increment=True)
+
+        assert rev0.revision == 0
+        assert rev1.revision == 1
+        assert rev0.hash == rev1.hash
+
+        storage = load_database(file_name)
+        assert storage.trial_hashes[rev0.hash] == {rev0.uid, rev1.uid}
+
+        # fresh protocol reading from the file
+        trials = FileProtocol(f'file://{file_name}').get_trial(make_trial())
+        assert [t.uid for t in trials] == [rev0.uid, rev1.uid]
+
+
+if __name__ == '__main__':
+    test_trial_revisions()
@@ -1,3 +1,6 @@
+import os
+
+import track.versioning as versioning
 from track.versioning import default_version_hash
 
 
@@ -6,5 +9,50 @@ def test_version():
     assert default_version_hash() != '666aaaeaad7ea654f29904d66ad81e07fb54af25df5217ff6254e79d28205199'
 
 
+def test_version_cache():
+    calls = []
+    compute_version = versioning.compute_version
+
+    def counting_compute_version(files, *args, **kwargs):
+        calls.append(files)
+        return compute_version(files, *args, **kwargs)
+
+    stat = os.stat(__file__)
+    versioning.compute_version = counting_compute_version
+    try:
+        default_version_hash.cache_clear()
+        version = default_version_hash()
+        assert len(calls) == 1
+
+        # cache hit
+        assert default_version_hash() == version
+        assert len(calls) == 1
+
+        # modifying a file on the stack invalidates the entry
+        os.utime(__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        assert default_version_hash() == version
+        assert len(calls) == 2
+
+        default_version_hash.cache_clear()
+        assert default_version_hash() == version
+        assert len(calls) == 3
+    finally:
+        versioning.compute_version = compute_version
+        os.utime(__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_version_algo():
+    assert len(default_version_hash()) == 32
+    assert len(default_version_hash(version_algo='sha256')) == 64
+
+    os.environ['TRACK_LOG_VERSION_ALGO'] = 'sha256'
+    try:
+        assert default_version_hash() == default_version_hash(version_algo='sha256')
+    finally:
+        os.environ.pop('TRACK_LOG_VERSION_ALGO')
+
+
 if __name__ == '__main__':
     test_version()
+    test_version_cache()
+    test_version_algo()
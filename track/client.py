@@ -1,5 +1,6 @@
-import json
 import os
+import sys
+import types
 
 from typing import Union, Callable, Dict, Optional
 
@@ -8,17 +9,38 @@ from track.structure import Trial, Project, TrialGroup
 
 from track.logger import TrialLogger
 from track.persistence import get_protocol
-from track.serialization import to_json
+from track.serialization import dumps
 from track.versioning import default_version_hash
 from track.configuration import options
 from track.utils.delay import delay_call, is_delayed_call
 from track.utils.log import warning, debug, info
+from track.utils.system import get_torch, is_cuda_available
 
 
 class TrialDoesNotExist(Exception):
     pass
 
 
+_missing = object()
+
+
+def _print_bytes(data: bytes):
+    """Write already encoded data to stdout, skipping the text layer when possible"""
+    out = sys.stdout
+    buffer = getattr(out, 'buffer', None)
+
+    # stdout might have been replaced (capture_output, pytest) by an object without binary buffer
+    if buffer is None:
+        out.write(data.decode('utf8'))
+        out.write('\n')
+        return
+
+    out.flush()
+    buffer.write(data)
+    buffer.write(b'\n')
+    buffer.flush()
+
+
 # pylint: disable=too-many-public-methods
 class TrackClient:
     """ TrackClient. A client tracks a single Trial being ran
@@ -28,6 +50,8 @@ class TrackClient:
     backend: str
         Storage backend to use
     """
+    # one client is created per trial; slots avoid an instance __dict__
+    __slots__ = ('project', 'group', 'trial', 'protocol', 'version', '_logger', '_forwarded')
 
     def __init__(self, backend=options('log.backend.name', default='none')):
         self.project = None
@@ -35,6 +59,8 @@ class TrackClient:
         self.trial = None
 
         self.protocol = get_protocol(backend)
+        # logger methods cached by __getattr__
+        self._forwarded = dict()
         self.logger: TrialLogger = None
         self.set_version()
 
@@ -55,6 +81,16 @@ class TrackClient:
         if orion_trial is not None:
             self.set_trial(uid=orion_trial)
 
+    @property
+    def logger(self) -> TrialLogger:
+        return self._logger
+
+    @logger.setter
+    def logger(self, logger: TrialLogger):
+        # the cached methods are bound to the previous logger
+        self._forwarded.clear()
+        self._logger = logger
+
     def set_version(self, version=None, version_fun: Callable[[], str] = None):
         """Compute the version tag from the function call stack. Defaults to compute the hash of the executed file
 
@@ -262,16 +298,23 @@ class TrackClient:
             return self.trial
 
             # replace the trial or delayed trial by its actual value
+        reused = True
         if self.trial is None or is_delayed_call(self.trial):
             self.trial = self._make_trial(arguments=arguments, **kwargs)
+            reused = False
 
         if self.project is None:
             self.project = self.set_project(name='orphan')
 
-        self.protocol.add_project_trial(self.project, self.trial)
+        # when reconfiguring (force=True) the trial might already be attached, skip the storage round-trip.
+        # A new trial is always attached: the local storage of a multiplexed protocol already links it
+        # but the remote backends still need the call
+        if not reused or self.trial.project_id != self.project.uid or self.trial not in self.project.trials:
+            self.protocol.add_project_trial(self.project, self.trial)
 
         if self.group is not None:
-            self.protocol.add_group_trial(self.group, self.trial)
+            if not reused or self.trial.group_id != self.group.uid or self.trial.uid not in self.group.trials:
+                self.protocol.add_group_trial(self.group, self.trial)
 
         return self.trial
 
@@ -367,15 +410,18 @@ class TrackClient:
             self.logger.log_arguments(**kwargs)
 
         if show:
-            print('-' * 80)
-            for k, v in vars(args).items():
-                print(f'{k:>30}: {v}')
-            print('-' * 80)
+            lines = ['-' * 80]
+            lines.extend(f'{k:>30}: {v}' for k, v in kwargs.items())
+            lines.append('-' * 80)
+            sys.stdout.write('\n'.join(lines) + '\n')
 
         return args
 
     def __getattr__(self, item):
         """Try to use the backend attributes if not available"""
+        attr = self._forwarded.get(item)
+        if attr is not None:
+            return attr
 
         if is_delayed_call(self.trial):
             warning('Creating a trial without parameters!')
@@ -383,15 +429,20 @@ class TrackClient:
             self.trial = self.logger.trial
 
         # Look for the attribute in the top level logger
-        if hasattr(self.logger, item):
-            return getattr(self.logger, item)
+        attr = getattr(self.logger, item, _missing)
+        if attr is _missing:
+            raise AttributeError(item)
+
+        # methods do not change while the logger is the same; cache them so next lookups skip the logger
+        if isinstance(attr, types.MethodType):
+            self._forwarded[item] = attr
 
-        raise AttributeError(item)
+        return attr
 
     def report(self, short=True):
         """Print a digest of the logged metrics"""
         self.logger.finish()
-        print(json.dumps(to_json(self.trial, short), indent=2))
+        _print_bytes(dumps(self.trial, short, exact=False))
         return self
 
     def save(self, file_name_override=None):
@@ -401,9 +452,9 @@ class TrackClient:
     @staticmethod
     def get_device():
         """Helper function that returns a cuda device if available else a cpu"""
-        import torch
+        torch = get_torch()
 
-        if torch.cuda.is_available():
+        if is_cuda_available():
             return torch.device('cuda')
         return torch.device('cpu')
 
@@ -1,4 +1,4 @@
-import inspect
+import sys
 from typing import Callable
 
 from track.utils.stat import StatStream
@@ -18,6 +18,7 @@ from track.utils.signal import SignalHandler
 from track.utils.throttle import throttled
 from track.utils.eta import EstimatedTime
 from track.utils.out import RingOutputDecorator
+from track.utils.system import read_file
 
 ring_aggregator = RingAggregator.lazy(10, float32)
 stat_aggregator = StatAggregator.lazy(1)
@@ -220,12 +221,17 @@ class TrialLogger:
         pass
 
     def log_code(self):
-        self.code = open(inspect.stack()[-1].filename, 'r').read()
+        """save the source code of the main script"""
+        # only the bottom frame is needed, inspect.stack() would load the source of every frame
+        frame = sys._getframe(0)
+        while frame.f_back is not None:
+            frame = frame.f_back
+
+        self.code = read_file(frame.f_code.co_filename)
         return self
 
     def capture_output(self, output_size=50):
         """capture standard output"""
-        import sys
         do_stderr = sys.stderr is not sys.stdout
 
         self.stdout = RingOutputDecorator(file=sys.stdout, n_entries=options('log.stdout_capture', output_size))
@@ -2,10 +2,9 @@ from track.persistence.protocol import Protocol
 from track.persistence.utils import parse_uri
 from track.aggregators.aggregator import Aggregator, StatAggregator
 from track.structure import Trial, TrialGroup, Project, Status, CustomStatus, _STATUS_STR
-from track.serialization import to_json, from_json
+from track.serialization import from_json, dumps
 from track.utils.log import info, debug
 
-import json
 import time
 
 import psycopg2
@@ -413,7 +412,8 @@ class Cockroach(Protocol):
 
     @staticmethod
     def serialize(obj):
-        return json.dumps(to_json(obj))
+        # psycopg2 expects a str for the jsonb parameters
+        return dumps(obj, pretty=False).decode('utf8')
 
     @staticmethod
     def deserialize(obj):
@@ -104,8 +104,10 @@ class LockFileRemover(SignalHandler):
 
     def remove(self):
         import os
-        if os.path.exists(self.file_name):
+        try:
             os.remove(self.file_name)
+        except FileNotFoundError:
+            pass
 
     def sigterm(self, signum, frame):
         self.remove()
@@ -299,12 +301,11 @@ class FileProtocol(Protocol):
         trials = []
 
         if trial.uid in self.storage.objects:
-            trial_hash = trial.hash
-
-            for k, obj in self.storage.objects.items():
-                if k.startswith(trial_hash):
-                    trials.append(obj)
+            for uid in self.storage.trial_hashes.get(trial.hash, ()):
+                trials.append(self.storage.objects[uid])
 
+            # the index is a set; oldest revision first like the insertion order of the storage
+            trials.sort(key=lambda t: int(t.revision))
             return trials
         return None
 
@@ -326,6 +327,7 @@ class FileProtocol(Protocol):
 
         self.storage.objects[trial.uid] = trial
         self.storage.trials.add(trial.uid)
+        self.storage.add_trial_revision(trial)
 
         if trial.project_id is not None:
             project = self.storage.objects.get(trial.project_id)
@@ -11,7 +11,7 @@ from track.persistence.utils import parse_uri
 from track.utils import open_socket, listen_socket
 from track.aggregators.aggregator import Aggregator, StatAggregator
 from track.structure import Trial, TrialGroup, Project
-from track.serialization import to_json, from_json
+from track.serialization import to_json, from_json, dumps, loads
 from track.utils.log import error, warning, info
 from track.utils.throttle import throttle_repeated
 
@@ -20,16 +20,15 @@ from typing import Callable
 import traceback
 import time
 import asyncio
-import json
 import struct
 
 
 def to_bytes(message) -> bytes:
-    return json.dumps(message).encode('utf8')
+    return dumps(message, pretty=False)
 
 
 def to_obj(message: bytes) -> any:
-    return from_json(json.loads(message))
+    return from_json(loads(message))
 
 
 def send(socket, msg):
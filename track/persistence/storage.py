@@ -1,5 +1,4 @@
 import os
-import json
 from dataclasses import dataclass, field
 from typing import Dict, Set
 import tempfile
@@ -7,8 +6,9 @@ from uuid import UUID
 
 from track.utils.log import error, warning, debug
 from track.structure import Project, Trial, TrialGroup
-from track.serialization import from_json, to_json
+from track.serialization import from_json, dumps, loads
 from track.aggregators.aggregator import StatAggregator
+from track.utils.system import read_file
 
 
 _print_warning_once = set()
@@ -26,6 +26,7 @@ class LocalStorage:
     _project_names: Dict[str, UUID] = field(default_factory=dict)
     _group_names: Dict[str, UUID] = field(default_factory=dict)
     _trial_names: Dict[str, UUID] = field(default_factory=dict)
+    _trial_hashes: Dict[str, Set[UUID]] = field(default_factory=dict)
 
     _old_rev_tags: Dict[str, int] = field(default_factory=dict)
 
@@ -64,6 +65,14 @@ class LocalStorage:
     def group_names(self) -> Dict[str, UUID]:
         return self._group_names
 
+    @property
+    def trial_hashes(self) -> Dict[str, Set[UUID]]:
+        """uids of all the revisions of a trial"""
+        return self._trial_hashes
+
+    def add_trial_revision(self, trial):
+        self._trial_hashes.setdefault(trial.hash, set()).add(trial.uid)
+
     def commit(self, file_name_override=None, **kwargs):
         if file_name_override is None:
             file_name_override = self.target_file
@@ -73,24 +82,43 @@ class LocalStorage:
             return None
 
         # only save top level projects
-        objects = []
-        for uid in self._projects:
-            objects.append(to_json(self._objects[uid]))
-            # print(json.dumps(objects[-1], indent=2))
-
-        file_name = tempfile.mktemp('track_uncommitted')
-
-        with open(file_name, 'w') as output:
-            json.dump(objects, output, indent=2)
-
-        # mv is kind of atomic so this prevent generating half generated files
-        os.rename(file_name, file_name_override)
+        objects = [self._objects[uid] for uid in self._projects]
+
+        data = memoryview(dumps(objects))
+
+        # write next to the target so the rename never crosses file systems
+        # the name is unique so concurrent writers without the file lock do not truncate each other's file
+        fd, file_name = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(file_name_override)), suffix='.uncommitted')
+        try:
+            try:
+                # mkstemp creates the file readable by the owner only
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(fd, 0o644)
+
+                # one large write; loop only in case the OS accepted part of the buffer
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+
+            # mv is atomic on POSIX so this prevent generating half generated files
+            os.replace(file_name, file_name_override)
+
+        # do not leave the temporary file next to the user's storage
+        except BaseException:
+            try:
+                os.remove(file_name)
+            except FileNotFoundError:
+                pass
+            raise
 
     def _insert_object(self, obj):
         self._objects[obj.uid] = obj
 
         if isinstance(obj, Trial):
             self._trials.add(obj.uid)
+            self.add_trial_revision(obj)
 
         elif isinstance(obj, TrialGroup):
             self._groups.add(obj.uid)
@@ -173,15 +201,18 @@ def load_database(json_name):
     if json_name is None:
         return LocalStorage()
 
-    if not os.path.exists(json_name):
+    # open directly instead of checking if the file exists first; saves a stat on every (re)load
+    try:
+        data = read_file(json_name)
+
+    except FileNotFoundError:
         if json_name not in _print_warning_once:
             warning(f'Local Storage was not found at {json_name}')
             _print_warning_once.add(json_name)
 
         return LocalStorage(target_file=json_name)
 
-    with open(json_name, 'r') as file:
-        objects = json.load(file)
+    objects = loads(data)
 
     db = dict()
     projects = set()
@@ -190,6 +221,7 @@ def load_database(json_name):
     group_names = dict()
     trials = set()
     trial_names = dict()
+    trial_hashes = dict()
 
     for item in objects:
         obj = from_json(item)
@@ -210,6 +242,7 @@ def load_database(json_name):
             for trial in obj.trials:
                 db[trial.uid] = trial
                 trials.add(trial.uid)
+                trial_hashes.setdefault(trial.hash, set()).add(trial.uid)
 
             for group in obj.groups:
                 db[group.uid] = group
@@ -217,6 +250,7 @@ def load_database(json_name):
 
         elif isinstance(obj, Trial):
             trials.add(obj.uid)
+            trial_hashes.setdefault(obj.hash, set()).add(obj.uid)
             if obj.name is not None:
                 trial_names[obj.name] = obj.uid
 
@@ -225,4 +259,4 @@ def load_database(json_name):
             if obj.name is not None:
                 group_names[obj.name] = obj.uid
 
-    return LocalStorage(json_name, db, projects, groups, trials, project_names, group_names, trial_names)
+    return LocalStorage(json_name, db, projects, groups, trials, project_names, group_names, trial_names, trial_hashes)
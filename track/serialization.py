@@ -1,18 +1,26 @@
 from uuid import UUID
 from typing import Dict
 import datetime
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from track.chrono import ChronoContext
 from track.structure import Project, Trial, TrialGroup, Status, status, CustomStatus
 
 
 class SerializerAspect:
-    def to_json(self, obj: any, short=False):
+    """Convert an object to a json-ready dictionary.
+    `encode` is used to convert the nested values, it defaults to the recursive :func:`to_json`"""
+    def to_json(self, obj: any, short=False, encode=None):
         raise NotImplementedError()
 
 
 class SerializerUUID(SerializerAspect):
-    def to_json(self, obj: UUID, short=False):
+    def to_json(self, obj: UUID, short=False, encode=None):
         return str(obj)
 
 
@@ -20,7 +28,8 @@ class SerializerTrial(SerializerAspect):
     ignore_short = {'dtype', 'hash', 'uid', 'project_id', 'group_id'}
     ignore_meta = {'_update_count', '_last_change', 'heartbeat'}
 
-    def to_json(self, obj: Trial, short=False):
+    def to_json(self, obj: Trial, short=False, encode=None):
+        encode = encode or to_json
         stat = obj.status
 
         if not isinstance(stat, dict):
@@ -31,7 +40,7 @@ class SerializerTrial(SerializerAspect):
 
         trial = {
             'dtype': 'trial',
-            'uid': to_json(obj.uid),
+            'uid': encode(obj.uid),
             'revision': obj.revision,
             'hash': obj.hash,
             'name': obj.name,
@@ -40,10 +49,10 @@ class SerializerTrial(SerializerAspect):
             'tags': obj.tags,
             'group_id': obj.group_id,
             'project_id': obj.project_id,
-            'parameters': to_json(obj.parameters, short),
-            'metadata': to_json(obj.metadata, short),
-            'metrics': to_json(obj.metrics, short),
-            'chronos': to_json(obj.chronos, short),
+            'parameters': encode(obj.parameters, short),
+            'metadata': encode(obj.metadata, short),
+            'metrics': encode(obj.metrics, short),
+            'chronos': encode(obj.chronos, short),
             'errors': obj.errors,
             'status': stat
         }
@@ -51,18 +60,18 @@ class SerializerTrial(SerializerAspect):
             for i in self.ignore_short:
                 trial.pop(i, None)
 
-            for i in self.ignore_meta:
-                trial['metadata'].pop(i, None)
-
+            # metadata might be the trial's own dictionary, do not modify it in place
+            trial['metadata'] = {k: v for k, v in trial['metadata'].items() if k not in self.ignore_meta}
             trial['version'] = trial['version'][0:10]
         return trial
 
 
 class SerializerTrialGroup(SerializerAspect):
-    def to_json(self, obj: TrialGroup, short=False):
+    def to_json(self, obj: TrialGroup, short=False, encode=None):
+        encode = encode or to_json
         return {
             'dtype': 'trial_group',
-            'uid': to_json(obj.uid),
+            'uid': encode(obj.uid),
             'name': obj.name,
             'description': obj.description,
             'metadata': obj.metadata,
@@ -72,26 +81,27 @@ class SerializerTrialGroup(SerializerAspect):
 
 
 class SerializerProject(SerializerAspect):
-    def to_json(self, obj: Project, short=False):
+    def to_json(self, obj: Project, short=False, encode=None):
+        encode = encode or to_json
         p = {
             'dtype': 'project',
-            'uid': to_json(obj.uid),
+            'uid': encode(obj.uid),
             'name': obj.name,
             'description': obj.description,
             'metadata': obj.metadata,
-            'trials': [to_json(t, short) for t in obj.trials],
-            'groups': [to_json(g, short) for g in obj.groups]
+            'trials': [encode(t, short) for t in obj.trials],
+            'groups': [encode(g, short) for g in obj.groups]
         }
         return p
 
 
 class SerializerChronoContext(SerializerAspect):
-    def to_json(self, obj: any, short=False):
+    def to_json(self, obj: any, short=False, encode=None):
         return {}
 
 
 class SerializerStatus(SerializerAspect):
-    def to_json(self, obj: Status, short=False):
+    def to_json(self, obj: Status, short=False, encode=None):
         return {
             'name': obj.name,
             'value': obj.value
@@ -99,7 +109,7 @@ class SerializerStatus(SerializerAspect):
 
 
 class SerializerDatetime(SerializerAspect):
-    def to_json(self, obj: datetime.datetime, short=False):
+    def to_json(self, obj: datetime.datetime, short=False, encode=None):
 
         return (obj - datetime.datetime(1970, 1, 1)).total_seconds()
 
@@ -137,6 +147,81 @@ def to_json(k: any, short=False):
     return k
 
 
+def _passthrough(k: any, short=False):
+    """Leave nested values as is, the serializer will call `_fallback` on the types it does not know.
+    Dictionaries are still walked so their keys are converted with `str` like :func:`to_json` does"""
+    if isinstance(k, dict):
+        return {str(key): _passthrough(v, short) for key, v in k.items()}
+
+    return k
+
+
+def _make_fallback(short=False):
+    def _fallback(obj: any):
+        """Only called by the serializer for the types it does not support natively"""
+        aspect = serialization_aspects.get(type(obj))
+
+        if aspect is not None:
+            return aspect.to_json(obj, short, encode=_passthrough)
+
+        if hasattr(obj, 'state_dict'):
+            return obj.state_dict()
+
+        if hasattr(obj, 'to_json'):
+            return obj.to_json(short)
+
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+    return _fallback
+
+
+if orjson is not None:
+    _orjson_options = (
+        orjson.OPT_SERIALIZE_NUMPY |
+        orjson.OPT_NON_STR_KEYS |
+        # let our aspects handle those so the output stays compatible with `from_json`
+        orjson.OPT_PASSTHROUGH_DATACLASS |
+        orjson.OPT_PASSTHROUGH_DATETIME)
+
+
+def dumps(obj: any, short=False, pretty=True, exact=True) -> bytes:
+    """Serialize an object to utf8 encoded bytes.
+
+    Unlike :func:`to_json` the object is not converted to a dictionary first, the serializer walks the object
+    and only calls back into python for the types it does not support natively (Trial, Project, Aggregator, ...)
+
+    orjson writes NaN and infinities as null, so it is only used when `exact` is false,
+    i.e. when the output is not read back (report). Data that is stored or sent uses the standard json module.
+
+    The result is kept as bytes, callers should write it to binary streams instead of decoding it
+    """
+    fallback = _make_fallback(short)
+    # plain dictionaries (tags, parameters, rpc payloads) get their keys converted like to_json
+    obj = _passthrough(obj, short)
+
+    if orjson is not None and not exact:
+        option = _orjson_options
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, default=fallback, option=option)
+
+    return json.dumps(obj, indent=2 if pretty else None, default=fallback).encode('utf8')
+
+
+def loads(data: bytes) -> any:
+    """Parse utf8 encoded json, the data does not need to be decoded first"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+
+        # orjson rejects the NaN and Infinity tokens written by the json module
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
+
+
 def from_json(obj: Dict[str, any]) -> any:
     if not isinstance(obj, dict):
         return obj
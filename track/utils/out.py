@@ -1,10 +1,11 @@
-from track.containers.ring import RingBuffer
+from collections import deque
 
 
 class RingOutputDecorator:
     def __init__(self, file=None, n_entries=50):
         self.file = file
-        self.entries = RingBuffer(n_entries, dtype=str)
+        # appending to a bounded deque drops the oldest entry in O(1)
+        self.entries = deque(maxlen=n_entries)
 
     def write(self, string):
         self.entries.append(string)
@@ -12,13 +13,13 @@ class RingOutputDecorator:
             self.file.write(string)
 
     def out(self):
-        return ''.join(self.entries.to_list())
+        return ''.join(self.entries)
 
     def flush(self):
         pass
 
     def output(self):
-        return ''.join(self.entries.to_list())
+        return ''.join(self.entries)
 
     def raw(self):
-        return self.entries.to_list()
+        return list(self.entries)
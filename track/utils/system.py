@@ -1,8 +1,54 @@
+import mmap
+import os
+
+_torch = None
+_cuda_available = None
+
+# files smaller than this are read directly, mapping them is not worth it
+MMAP_THRESHOLD = 65536
+
+
+def get_torch():
+    """Import torch on first use only, torch is an optional dependency that is slow to import"""
+    global _torch
+
+    if _torch is None:
+        import torch
+        _torch = torch
+
+    return _torch
+
+
+def is_cuda_available():
+    """Query the CUDA runtime once and cache the result"""
+    global _cuda_available
+
+    if _cuda_available is None:
+        _cuda_available = get_torch().cuda.is_available()
+
+    return _cuda_available
+
 
 def get_gpu_name():
     try:
-        import torch
+        torch = get_torch()
         current_device = torch.cuda.current_device()
         return torch.cuda.get_device_name(current_device)
     except ImportError:
         return None
+
+
+def read_file(file_name: str) -> bytes:
+    """Read a whole file in binary mode, large files are memory mapped and read in one go"""
+    with open(file_name, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+
+        if size < MMAP_THRESHOLD:
+            return file.read()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # python 3.8+ on unix
+            if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+            return bytes(mapped)
@@ -27,14 +27,14 @@ class TimeThrottler:
     """Limit how often the function `fun` is called in seconds"""
     def __init__(self, fun: Callable[[A], R], every=10):
         self.fun = fun
-        self.last_time: float = 0
-        self.every: float = every
+        # monotonic clock in ns; integer comparisons and not affected by system clock changes
+        self.every_ns: int = int(every * 1e9)
+        self.last_time: Optional[int] = None
 
     def __call__(self, *args, **kwargs) -> Optional[R]:
-        now = time.time()
-        elapsed = now - self.last_time
+        now = time.monotonic_ns()
 
-        if elapsed > self.every:
+        if self.last_time is None or now - self.last_time > self.every_ns:
             self.last_time = now
             return self.fun(*args, **kwargs)
 
@@ -45,14 +45,14 @@ class ThrottleRepeatedCalls:
     """Limit how often the function `fun` is called in number of times called"""
     def __init__(self, fun: Callable[[A], R], every=10):
         self.fun = fun
-        self.last_time: Dict[Tuple, float] = dict()
-        self.every: float = every
+        self.every_ns: int = int(every * 1e9)
+        self.last_time: Dict[Tuple, int] = dict()
 
     def __call__(self, *args, **kwargs) -> Optional[R]:
-        now = time.time()
-        elapsed = now - self.last_time.get(args, 0)
+        now = time.monotonic_ns()
+        last_time = self.last_time.get(args)
 
-        if elapsed > self.every:
+        if last_time is None or now - last_time > self.every_ns:
             self.last_time[args] = now
             return self.fun(*args, **kwargs)
 
@@ -1,8 +1,11 @@
 import hashlib
-import inspect
+import os
 import struct
+import sys
 from typing import Tuple, List
 
+from track.configuration import options
+
 
 def get_git_version(module) -> Tuple[str, str]:
     import git
@@ -19,13 +22,22 @@ def get_git_version(module) -> Tuple[str, str]:
 BUF_SIZE = 65536
 
 
-def get_file_version(file_name: str) -> str:
-    """ hash the file using sha256, used in combination with get_git_version to version non committed modifications """
-    return compute_version([file_name])
+def get_file_version(file_name: str, version_algo='sha256') -> str:
+    """ hash the file, used in combination with get_git_version to version non committed modifications """
+    return compute_version([file_name], version_algo)
 
 
-def compute_version(files: List[str]) -> str:
-    sha256 = hashlib.sha256()
+def _version_hasher(version_algo):
+    # versions are fingerprints not signatures, blake2b is faster than sha256 and 128 bits are plenty
+    if version_algo == 'blake2b':
+        return hashlib.blake2b(digest_size=16)
+
+    return hashlib.new(version_algo)
+
+
+def compute_version(files: List[str], version_algo='sha256') -> str:
+    """ hash the content of the files; sha256 by default so digests can be compared to published checksums """
+    hasher = _version_hasher(version_algo)
 
     for file in files:
         with open(file, 'rb') as code:
@@ -35,9 +47,9 @@ def compute_version(files: List[str]) -> str:
                 if not data:
                     break
 
-                sha256.update(data)
+                hasher.update(data)
 
-    return sha256.hexdigest()
+    return hasher.hexdigest()
 
 
 def is_iterable(iterable):
@@ -87,8 +99,40 @@ def compute_hash(*args, **kwargs):
     return sha256.hexdigest()
 
 
-def default_version_hash():
-    """ get the current stack frames and from the file compute the version"""
-    stack = inspect.stack()
-    files = [s.filename for s in stack]
-    return compute_version(files)
+_version_cache = dict()
+
+
+def default_version_hash(version_algo=None):
+    """ get the current stack frames and from the file compute the version.
+    The version is cached as long as the files on the stack are not modified.
+
+    The algorithm defaults to the `log.version_algo` option (blake2b).
+    Use `sha256` to get the versions computed by older releases and match the trials they recorded """
+    if version_algo is None:
+        version_algo = options('log.version_algo', 'blake2b')
+
+    key = [version_algo]
+    frame = sys._getframe(0)
+
+    while frame is not None:
+        file_name = frame.f_code.co_filename
+        frame = frame.f_back
+
+        try:
+            key.append((file_name, os.stat(file_name).st_mtime_ns))
+
+        # frozen modules and interactive sessions are not on the file system
+        except OSError:
+            pass
+
+    key = tuple(key)
+    version = _version_cache.get(key)
+
+    if version is None:
+        version = compute_version([file for file, _ in key[1:]], version_algo)
+        _version_cache[key] = version
+
+    return version
+
+
+default_version_hash.cache_clear = _version_cache.clear